@@ -3,4 +3,4 @@ Functions package for the encryption/decryption application.
 This package contains all the utility functions used in the application.
 """
 
-from functions.crypto import encrypt_number, decrypt_number
+from functions.crypto import encrypt_number, decrypt_number, encrypt_many, decrypt_many
@@ -4,6 +4,29 @@ This module contains functions for encrypting and decrypting 6-digit numbers.
 """
 
 
+# Translation tables mapping every digit character to its encrypted/decrypted
+# counterpart, so the per-digit arithmetic runs once at import instead of per call
+DIGITS = "0123456789"
+ENCRYPT_TABLE = str.maketrans(DIGITS, "".join(str((int(d) + 7) % 10) for d in DIGITS))
+DECRYPT_TABLE = str.maketrans(DIGITS, "".join(str((int(d) - 7 + 10) % 10) for d in DIGITS))
+
+
+def is_valid_number(number_str):
+    """
+    Check whether a string is a 6-digit number.
+
+    Only ASCII digits are accepted, since the translation tables map those alone.
+    The length is checked first so that wrong-sized input is rejected without scanning it.
+
+    Args:
+        number_str (str): The string to check.
+
+    Returns:
+        bool: True if the string consists of exactly 6 ASCII digits, False otherwise.
+    """
+    return len(number_str) == 6 and number_str.isascii() and number_str.isdigit()
+
+
 def swap_digits(digits):
     """
     Swap digits according to the encryption/decryption algorithm.
@@ -12,20 +35,14 @@ def swap_digits(digits):
     3. Swap the fifth digit with the sixth.
 
     Args:
-        digits (list): A list of 6 digits to be swapped.
+        digits (str): A string of 6 digit characters to be swapped, such as the output of
+            str.translate. Lists of ints are not accepted.
 
     Returns:
-        list: The list with swapped digits.
+        str: A new string with the swapped digits.
     """
-    # Create a copy of the list to avoid modifying the original
-    result = digits.copy()
-
-    # Swap digits
-    result[0], result[2] = result[2], result[0]  # 1st with 3rd
-    result[1], result[3] = result[3], result[1]  # 2nd with 4th
-    result[4], result[5] = result[5], result[4]  # 5th with 6th
-
-    return result
+    # Build the 6-character result directly: 3rd, 4th, 1st, 2nd, 6th, 5th
+    return f"{digits[2]}{digits[3]}{digits[0]}{digits[1]}{digits[5]}{digits[4]}"
 
 
 def encrypt_number(number_str):
@@ -42,19 +59,15 @@ def encrypt_number(number_str):
     Returns:
         str: The encrypted number as a string, or None if input is invalid.
     """
-    if not (number_str.isdigit() and len(number_str) == 6):
+    if not is_valid_number(number_str):
         # The UI will handle an error message
         return None
 
-    digits = [int(d) for d in number_str]
-
-    # Step 1: Encrypt each digit
-    encrypted_digits = [(d + 7) % 10 for d in digits]
+    # Step 1: Encrypt each digit using the precomputed translation table
+    encrypted_digits = number_str.translate(ENCRYPT_TABLE)
 
     # Steps 2, 3, and 4: Swap digits using the helper function
-    encrypted_digits = swap_digits(encrypted_digits)
-
-    return "".join(map(str, encrypted_digits))
+    return swap_digits(encrypted_digits)
 
 def decrypt_number(encrypted_str):
     """
@@ -69,17 +82,79 @@ def decrypt_number(encrypted_str):
     Returns:
         str: The decrypted number as a string, or None if input is invalid.
     """
-    if not (encrypted_str.isdigit() and len(encrypted_str) == 6):
+    if not is_valid_number(encrypted_str):
         # The UI will handle an error message
         return None
 
-    digits = [int(d) for d in encrypted_str]
-
     # Step 1: Reverse the digit swaps
     # The swap is symmetric, applying it again reverses the operation.
-    digits = swap_digits(digits)
+    digits = swap_digits(encrypted_str)
+
+    # Step 2: Decrypt each digit using the precomputed translation table
+    return digits.translate(DECRYPT_TABLE)
+
+
+def _convert_many(numbers, table):
+    """
+    Translate and swap the digits of a batch of 6-digit numbers.
+
+    The valid numbers are joined into one string, so the translation table is applied
+    in a single call, and the swap is done with one strided slice per digit position.
+    Translation works digit by digit, so its order relative to the swap does not matter
+    and the same steps serve both encryption and decryption.
+
+    Args:
+        numbers (iterable): 6-digit numbers as strings.
+        table (dict): The translation table, ENCRYPT_TABLE or DECRYPT_TABLE.
+
+    Returns:
+        list: The converted numbers as strings, with None for each invalid input.
+    """
+    numbers = list(numbers)
+    valid_flags = list(map(is_valid_number, numbers))
+    all_valid = all(valid_flags)
+    valid_numbers = numbers if all_valid else [n for n, valid in zip(numbers, valid_flags) if valid]
+
+    digits = "".join(valid_numbers).translate(table)
+    # Every 6th character starting at offset k is digit k of each number: 3rd, 4th, 1st, 2nd, 6th, 5th
+    converted = list(map("".join, zip(
+        digits[2::6], digits[3::6], digits[0::6], digits[1::6], digits[5::6], digits[4::6]
+    )))
+    if all_valid:
+        return converted
+
+    # Put None back in the positions of the invalid inputs
+    converted_iter = iter(converted)
+    return [next(converted_iter) if valid else None for valid in valid_flags]
+
+
+def encrypt_many(numbers):
+    """
+    Encrypts a batch of 6-digit numbers.
+
+    Gives the same results as calling encrypt_number on every element, but translates
+    all the valid numbers in one call instead of one call per number.
+
+    Args:
+        numbers (iterable): 6-digit numbers as strings.
+
+    Returns:
+        list: The encrypted numbers as strings, with None for each invalid input.
+    """
+    return _convert_many(numbers, ENCRYPT_TABLE)
+
 
-    # Step 2: Decrypt each digit
-    decrypted_digits = [(d - 7 + 10) % 10 for d in digits]
+def decrypt_many(encrypted_numbers):
+    """
+    Decrypts a batch of previously encrypted numbers.
 
-    return "".join(map(str, decrypted_digits))
+    Gives the same results as calling decrypt_number on every element, but translates
+    all the valid numbers in one call instead of one call per number.
+
+    Args:
+        encrypted_numbers (iterable): 6-digit encrypted numbers as strings.
+
+    Returns:
+        list: The decrypted numbers as strings, with None for each invalid input.
+    """
+    return _convert_many(encrypted_numbers, DECRYPT_TABLE)
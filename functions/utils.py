@@ -4,12 +4,248 @@ Utility functions for the application's UI.
 This module contains utility functions that are used by multiple UI components
 to avoid code duplication and ensure consistent behavior across the application.
 """
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QIntValidator
-from PyQt6.QtWidgets import (
-    QWidget, QPushButton, QHBoxLayout, QVBoxLayout,
-    QLabel, QLineEdit
-)
+import os
+from functools import lru_cache
+
+from PyQt6.QtCore import Qt, QObject, QRunnable, pyqtSignal
+from PyQt6.QtGui import QFont, QImage, QIntValidator, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtWidgets import QFrame, QPushButton, QLabel, QLineEdit
+
+
+@lru_cache(maxsize=None)
+def get_font(family, size, weight=QFont.Weight.Normal):
+    """
+    Get a shared font instance for the given family, size and weight.
+
+    Fonts are created once and reused, which avoids a font database lookup for
+    every widget. Sharing is safe because setFont copies the font it receives.
+
+    Args:
+        - family (str): The font family name.
+        - size (int): The point size of the font.
+        - weight (QFont.Weight): The font weight. Defaults to normal.
+
+    Returns:
+        QFont: The cached font.
+    """
+    return QFont(family, size, weight)
+
+
+@lru_cache(maxsize=None)
+def get_number_validator():
+    """
+    Get the shared validator for 6-digit number input fields.
+
+    Returns:
+        QIntValidator: A validator accepting numbers between 0 and 999,999.
+    """
+    return QIntValidator(0, 999999)
+
+
+def configure_layout(layout, margins=(20, 20, 20, 20), alignment=None):
+    """
+    Apply the standard margins and, optionally, an alignment to a layout.
+
+    Args:
+        - layout (QLayout): The layout to configure.
+        - margins (tuple): The left, top, right and bottom margins, or None to keep the
+          layout's default margins. Defaults to 20 pixels on every side.
+        - alignment (Qt.AlignmentFlag): The alignment of the layout's items, or None to
+          keep the default alignment.
+
+    Returns:
+        QLayout: The configured layout, so it can be created and configured in one statement.
+    """
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    if alignment is not None:
+        layout.setAlignment(alignment)
+    return layout
+
+
+def create_label(text, font, layout):
+    """
+    Create a centered label with the given font and add it to a layout.
+
+    Args:
+        - text (str): The text of the label.
+        - font (QFont): The font of the label, usually obtained from get_font.
+        - layout (QLayout): The layout to add the label to.
+
+    Returns:
+        QLabel: The created label.
+    """
+    label = QLabel(text)
+    label.setFont(font)
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    layout.addWidget(label)
+    return label
+
+
+class StyledFrame(QFrame):
+    """
+    Frame with the application's semi-transparent white background.
+
+    The styling comes from the QFrame#StyledFrame rule of the global stylesheet,
+    which Qt resolves once, instead of a stylesheet parsed for every frame.
+    """
+    def __init__(self, parent=None):
+        """
+        Initialize the frame and give it the object name used by the global stylesheet.
+
+        Args:
+            - parent (QWidget): The parent widget of the frame. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setObjectName("StyledFrame")
+
+
+def asset_path(name):
+    """
+    Get the absolute path of a file in the assets directory.
+
+    The path is resolved from this module's location, so the assets are found
+    whatever the directory the application is launched from.
+
+    Args:
+        - name (str): The file name inside the assets directory.
+
+    Returns:
+        str: The absolute path to the file.
+    """
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", name)
+
+
+def load_stylesheet(path):
+    """
+    Load a Qt stylesheet (QSS) from a file.
+
+    Args:
+        - path (str): The path to the .qss file.
+
+    Returns:
+        str: The stylesheet text, ready to pass to setStyleSheet.
+    """
+    with open(path, encoding="utf-8") as stylesheet_file:
+        return stylesheet_file.read()
+
+
+def fade_image(path, opacity):
+    """
+    Load an image and bake the given opacity into it.
+
+    Baking the opacity into the image lets widgets draw it directly, instead of
+    using a QGraphicsOpacityEffect that renders offscreen on every paint.
+    Only QImage is used, so this function is safe to call from a worker thread.
+
+    Args:
+        - path (str): The path to the image file.
+        - opacity (float): The opacity of the image, from 0.0 (invisible) to 1.0 (opaque).
+
+    Returns:
+        QImage: The image with the opacity applied, or a null image if the file
+        could not be loaded.
+    """
+    image = QImage(path)
+    if image.isNull():
+        # Missing or undecodable file: there is nothing to paint
+        return image
+
+    faded_image = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    faded_image.fill(Qt.GlobalColor.transparent)
+
+    # Draw the original image onto the transparent image at the requested opacity
+    painter = QPainter(faded_image)
+    painter.setOpacity(opacity)
+    painter.drawImage(0, 0, image)
+    painter.end()
+
+    return faded_image
+
+
+def _faded_pixmap_key(path, opacity):
+    """
+    Build the QPixmapCache key of a faded image.
+
+    Args:
+        - path (str): The path to the image file.
+        - opacity (float): The opacity baked into the image.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"faded:{opacity}:{path}"
+
+
+def find_faded_pixmap(path, opacity):
+    """
+    Look up a faded image in Qt's global QPixmapCache.
+
+    Args:
+        - path (str): The path to the image file.
+        - opacity (float): The opacity baked into the image.
+
+    Returns:
+        QPixmap: The cached pixmap, or None if it is not in the cache.
+    """
+    return QPixmapCache.find(_faded_pixmap_key(path, opacity))
+
+
+def cache_faded_image(path, opacity, faded_image):
+    """
+    Convert a faded image to a pixmap and store it in Qt's global QPixmapCache.
+
+    Must be called from the GUI thread, as pixmaps can only be created there.
+
+    Args:
+        - path (str): The path to the image file.
+        - opacity (float): The opacity baked into the image.
+        - faded_image (QImage): The image returned by fade_image.
+
+    Returns:
+        QPixmap: The cached pixmap.
+    """
+    faded_pixmap = QPixmap.fromImage(faded_image)
+    QPixmapCache.insert(_faded_pixmap_key(path, opacity), faded_pixmap)
+    return faded_pixmap
+
+
+class FadedImageSignals(QObject):
+    """
+    Signals emitted by FadedImageLoader.
+
+    QRunnable is not a QObject, so its signals live on this separate object.
+    """
+    # Emitted with the faded QImage once it has been loaded
+    loaded = pyqtSignal(QImage)
+
+
+class FadedImageLoader(QRunnable):
+    """
+    Task that loads and fades an image on a QThreadPool worker thread.
+
+    Decoding the image off the GUI thread lets a window appear before its image is
+    ready. The result is delivered as a QImage through signals.loaded; receivers in
+    the GUI thread should pass it to cache_faded_image to get a pixmap.
+    """
+    def __init__(self, path, opacity):
+        """
+        Initialize the loader.
+
+        Args:
+            - path (str): The path to the image file.
+            - opacity (float): The opacity of the image, from 0.0 (invisible) to 1.0 (opaque).
+        """
+        super().__init__()
+        self.path = path
+        self.opacity = opacity
+        self.signals = FadedImageSignals()
+
+    def run(self):
+        """
+        Load and fade the image, then emit it through signals.loaded.
+        """
+        self.signals.loaded.emit(fade_image(self.path, self.opacity))
 
 
 def center_on_screen(widget):
@@ -64,6 +300,7 @@ def create_back_button(main_window, action_button, button_layout, main_frame_lay
     Create a back button with standard styling and add it to the layouts.
 
     This function creates a gray "Back" button that navigates to the main page when clicked.
+    Its look comes from the #backButton rule of the global stylesheet.
     It adds both the action button and back button to the button layout and then adds
     the button layout to the main frame layout with appropriate spacing.
 
@@ -78,20 +315,8 @@ def create_back_button(main_window, action_button, button_layout, main_frame_lay
     """
     # Back button to return to the main page
     back_button = QPushButton("Back")
-    back_button.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-    back_button.setStyleSheet("""
-        QPushButton {
-            background-color: #808080;  /* Gray background */
-            color: white;  /* White text */
-            border: none;  /* No border */
-            border-radius: 5px;  /* Rounded corners */
-            padding: 10px 20px;  /* Add padding for better clickability */
-            min-width: 150px;  /* Minimum width for better appearance */
-        }
-        QPushButton:hover {
-            background-color: #606060;  /* Darker gray when hovered */
-        }
-    """)
+    back_button.setFont(get_font("Arial", 14, QFont.Weight.Bold))
+    back_button.setObjectName("backButton")  # Styled by the global stylesheet
     back_button.clicked.connect(main_window.show_main_page)  # Connect to navigation method
 
     # Add buttons to the horizontal layout
@@ -110,7 +335,7 @@ def create_input_field(label_text, main_frame_layout):
     Create an input label and entry field with standard styling and add them to the layout.
 
     This function creates a label with the provided text and a QLineEdit for input.
-    Both are styled consistently with the application's design and added to the provided layout.
+    Both are styled by the global stylesheet and added to the provided layout.
     The entry field is configured to accept only 6-digit numbers.
 
     Args:
@@ -121,30 +346,17 @@ def create_input_field(label_text, main_frame_layout):
         QLineEdit: The created entry field, which should be assigned to an instance variable.
     """
     # Input section with instructions
-    input_label = QLabel(label_text)
-    input_label.setFont(QFont("Arial", 14))
-    input_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    input_label.setStyleSheet("color: #212121;")  # Dark gray text
-    main_frame_layout.addWidget(input_label)
+    create_label(label_text, get_font("Arial", 14), main_frame_layout)
 
     # Entry field with improved visibility and styling
     entry_field = QLineEdit()
-    entry_field.setFont(QFont("Arial", 16))  # Larger font for better readability
+    entry_field.setFont(get_font("Arial", 16))  # Larger font for better readability
     entry_field.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the text
-    entry_field.setStyleSheet("""
-        QLineEdit {
-            background-color: white;  /* White background */
-            color: #212121;  /* Dark gray text */
-            border: 2px solid #000000;  /* Black border */
-            border-radius: 5px;  /* Rounded corners */
-            padding: 5px;  /* Inner padding */
-            margin: 10px 50px;  /* Margin around the field */
-        }
-    """)
+    entry_field.setObjectName("numberEntry")  # Styled by the global stylesheet
     entry_field.setFixedHeight(60)  # Fixed height for better appearance
     entry_field.setMaxLength(6)  # Limit input to 6 characters
     # Add validator to only accept numbers between 0 and 999,999
-    entry_field.setValidator(QIntValidator(0, 999999))
+    entry_field.setValidator(get_number_validator())
     main_frame_layout.addWidget(entry_field)
     main_frame_layout.addSpacing(20)  # Add vertical space
 
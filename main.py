@@ -13,60 +13,27 @@ The application consists of three main screens:
 Results are displayed in a modal dialog with copy-to-clipboard functionality.
 """
 import sys
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication
+from functions.utils import asset_path, load_stylesheet
 from windows.main_window import MainWindow
 
 if __name__ == "__main__":
     # Initialize the PyQt application
     app = QApplication(sys.argv)
 
-    # Set a global stylesheet for the application
+    # Set a global stylesheet for the application, loaded from the assets directory
     # This ensures consistent styling across all components
-    app.setStyleSheet("""
-        /* Context menu styling for right-click menus */
-        QMenu {
-            background-color: #f5f5f5;  /* Light gray background */
-            color: #212121;             /* Dark gray text for readability */
-            border: 1px solid #cccccc;  /* Light gray border */
-        }
-        /* Styling for selected menu items */
-        QMenu::item:selected {
-            background-color: #e0e0e0;  /* Slightly darker gray for hover state */
-        }
-
-        /* Message box styling for error and information dialogs */
-        QMessageBox {
-            background-color: #f5f5f5;  /* Light gray background */
-            color: #212121;             /* Dark gray text */
-        }
-
-        /* Styling for labels within message boxes */
-        QMessageBox QLabel {
-            color: #212121;             /* Dark gray text for readability */
-            font-size: 14px;            /* Larger font size for better visibility */
-        }
-
-        /* Styling for buttons within message boxes */
-        QMessageBox QPushButton {
-            background-color: #FF0000;  /* Red background for buttons */
-            color: black;               /* Black text for contrast */
-            border: 1px solid #cccccc;  /* Light gray border */
-            border-radius: 5px;         /* Rounded corners */
-            padding: 10px 20px;         /* Padding for better clickability */
-            min-width: 100px;           /* Minimum width for better appearance */
-            font-size: 14px;            /* Larger font size */
-            font-weight: bold;          /* Bold text for emphasis */
-        }
-
-        /* Hover state for buttons within message boxes */
-        QMessageBox QPushButton:hover {
-            background-color: #CC0000;  /* Darker red for hover state */
-        }
-    """)
+    app.setStyleSheet(load_stylesheet(asset_path("styles.qss")))
 
     # Create and show the main application window
     window = MainWindow()
     window.show()
 
-    # Start the application event loop and exit when it's done
-    sys.exit(app.exec())
+    # Start the application event loop
+    exit_code = app.exec()
+
+    # Let background image loaders finish before Python shuts down; a worker thread
+    # still running during interpreter shutdown crashes the process
+    QThreadPool.globalInstance().waitForDone()
+    sys.exit(exit_code)
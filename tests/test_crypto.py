@@ -0,0 +1,109 @@
+"""
+Tests for the encryption and decryption functions.
+
+Checks the batch API against the single-number functions, which implement the
+algorithm described in the crypto module.
+"""
+import os
+import sys
+import unittest
+
+# Make the application packages importable when running from the tests directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.crypto import (
+    decrypt_many, decrypt_number, encrypt_many, encrypt_number, is_valid_number
+)
+
+# Sample of valid 6-digit numbers, including leading zeros and repeated digits
+VALID_NUMBERS = ["000000", "123456", "999999", "012345", "987650", "100001", "555555"]
+
+# Inputs rejected by the single-number functions
+INVALID_NUMBERS = ["", "12345", "1234567", "12a456", " 12345", "-12345", "\u0661\u0662\u0663\u0664\u0665\u0666"]
+
+
+class IsValidNumberTest(unittest.TestCase):
+    """
+    Check which strings is_valid_number accepts.
+    """
+    def test_accepts_six_ascii_digits(self):
+        """
+        Exactly 6 ASCII digits are accepted.
+        """
+        for number in VALID_NUMBERS:
+            with self.subTest(number=number):
+                self.assertTrue(is_valid_number(number))
+
+    def test_rejects_invalid_input(self):
+        """
+        Wrong lengths, non-digit characters and non-ASCII digits are rejected.
+        """
+        for number in INVALID_NUMBERS:
+            with self.subTest(number=number):
+                self.assertFalse(is_valid_number(number))
+
+
+class BatchCryptoTest(unittest.TestCase):
+    """
+    Check that encrypt_many and decrypt_many match encrypt_number and decrypt_number.
+    """
+    def test_matches_single_number_functions(self):
+        """
+        Each batch result equals the result of the single-number function.
+        """
+        self.assertEqual(encrypt_many(VALID_NUMBERS), [encrypt_number(n) for n in VALID_NUMBERS])
+        self.assertEqual(decrypt_many(VALID_NUMBERS), [decrypt_number(n) for n in VALID_NUMBERS])
+
+    def test_known_value(self):
+        """
+        A number encrypts to the value given by the algorithm and decrypts back.
+        """
+        self.assertEqual(encrypt_many(["123456"]), ["018932"])
+        self.assertEqual(decrypt_many(["018932"]), ["123456"])
+
+    def test_mixed_valid_and_invalid(self):
+        """
+        Invalid inputs give None in their own positions, valid ones are still converted.
+        """
+        numbers = ["123456", "12a456", "000000", "", "999999", "1234567", "\u0661\u0662\u0663\u0664\u0665\u0666"]
+        expected = [encrypt_number(n) for n in numbers]
+        self.assertEqual(encrypt_many(numbers), expected)
+        self.assertEqual(expected, ["018932", None, "777777", None, "666666", None, None])
+        self.assertEqual(decrypt_many(numbers), [decrypt_number(n) for n in numbers])
+
+    def test_only_invalid(self):
+        """
+        A batch with no valid input gives None for every element.
+        """
+        self.assertEqual(encrypt_many(INVALID_NUMBERS), [None] * len(INVALID_NUMBERS))
+        self.assertEqual(decrypt_many(INVALID_NUMBERS), [None] * len(INVALID_NUMBERS))
+
+    def test_empty_input(self):
+        """
+        An empty batch gives an empty list.
+        """
+        self.assertEqual(encrypt_many([]), [])
+        self.assertEqual(decrypt_many([]), [])
+
+    def test_generator_input(self):
+        """
+        Any iterable is accepted, including a generator consumed only once.
+        """
+        self.assertEqual(
+            encrypt_many(n for n in VALID_NUMBERS), [encrypt_number(n) for n in VALID_NUMBERS]
+        )
+        self.assertEqual(
+            decrypt_many(n for n in VALID_NUMBERS), [decrypt_number(n) for n in VALID_NUMBERS]
+        )
+
+    def test_round_trip(self):
+        """
+        Decrypting the encrypted batch gives back the original numbers.
+        """
+        self.assertEqual(decrypt_many(encrypt_many(VALID_NUMBERS)), VALID_NUMBERS)
+        all_numbers = [f"{n:06d}" for n in range(0, 1000000, 997)]
+        self.assertEqual(decrypt_many(encrypt_many(all_numbers)), all_numbers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Smoke test for the main window.
+
+Builds the MainWindow on Qt's offscreen platform, so it runs without a display,
+and checks that the application can start, load its background image and navigate
+between its pages.
+"""
+import os
+import sys
+import unittest
+
+# Use the offscreen platform unless another one was explicitly requested
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Make the application packages importable when running from the tests directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from windows.main_window import MainWindow
+
+
+class MainWindowSmokeTest(unittest.TestCase):
+    """
+    Check that the main window can be built, shown and navigated.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create the QApplication shared by all tests.
+        """
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_build_and_navigate(self):
+        """
+        Build the window, show it, wait for its background and visit every page.
+        """
+        window = MainWindow()
+        window.show()
+
+        # Wait for the background image to be decoded, then deliver it to the window
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+        background_label = window.main_page.findChild(QLabel, "backgroundLabel")
+        self.assertFalse(background_label.pixmap().isNull())
+
+        window.show_encrypt_page()
+        self.assertTrue(window.encrypt_page.isVisible())
+        window.show_decrypt_page()
+        self.assertTrue(window.decrypt_page.isVisible())
+        self.assertFalse(window.encrypt_page.isVisible())
+        window.show_main_page()
+        self.assertTrue(window.main_page.isVisible())
+
+        window.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
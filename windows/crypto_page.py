@@ -0,0 +1,160 @@
+"""
+Encryption and decryption page for the application.
+
+This module defines the CryptoPage class, which provides the user interface for
+encrypting or decrypting 6-digit numbers. The same page is used for both operations
+and is parameterized by a CryptoMode, which holds the texts, the action button's
+object name (which the global stylesheet colors it by) and the crypto function that
+differ between them. It allows users to input a number, process it using the algorithm
+defined in the crypto module, and view the result in a modal dialog.
+
+The page includes:
+- A title
+- An input field for entering a 6-digit number
+- Buttons for processing the number and returning to the main page
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QMessageBox
+)
+
+from functions.crypto import encrypt_number, decrypt_number
+from functions.utils import (
+    StyledFrame, configure_layout, create_back_button, create_input_field, create_label, get_font
+)
+
+
+@dataclass(frozen=True)
+class CryptoMode:
+    """
+    Texts, button style and crypto function that define a CryptoPage.
+
+    Attributes:
+        title (str): The title displayed at the top of the page.
+        input_label (str): The instructions displayed above the input field.
+        button_label (str): The text of the action button.
+        button_name (str): The object name the global stylesheet styles the action button by.
+        fn (Callable): The crypto function applied to the entered number.
+    """
+    title: str
+    input_label: str
+    button_label: str
+    button_name: str
+    fn: Callable
+
+
+# Encryption page: red button with lock emoji
+ENCRYPT_MODE = CryptoMode(
+    title="Number Encryption",
+    input_label="Enter a 6-digit number:",
+    button_label="🔒 Encrypt",
+    button_name="encryptButton",
+    fn=encrypt_number,
+)
+
+# Decryption page: teal button with unlocked emoji
+DECRYPT_MODE = CryptoMode(
+    title="Number Decryption",
+    input_label="Enter the encrypted number (6 digits):",
+    button_label="🔓 Decrypt",
+    button_name="decryptButton",
+    fn=decrypt_number,
+)
+
+
+class CryptoPage(QWidget):
+    """
+    Page for encrypting or decrypting 6-digit numbers.
+
+    This class provides a user interface for entering a 6-digit number,
+    processing it with the crypto function of its mode,
+    and displaying the result in a modal dialog.
+    """
+    def __init__(self, main_window, mode):
+        """
+        Initialize the encryption or decryption page.
+
+        Args:
+            main_window: The parent MainWindow instance that contains this page.
+                         Used for navigation back to the main page.
+            mode (CryptoMode): The texts, button style and crypto function of the page.
+        """
+        super().__init__()
+        self.number_entry = None
+        self.main_window = main_window
+        self.mode = mode
+        self.setup_ui()
+
+    def setup_ui(self):
+        """
+        Set up the user interface components for the page.
+
+        Creates the layout, frame, title, input field, and buttons.
+        Configures styling and connects signals to slots.
+        """
+        # Create the main layout with padding
+        main_layout = configure_layout(QVBoxLayout(self))  # Add padding around the edges
+
+        # Create the main frame with a semi-transparent background
+        main_frame = StyledFrame()  # Styled by the QFrame#StyledFrame rule in assets/styles.qss
+        main_frame_layout = configure_layout(QVBoxLayout(main_frame))  # Add padding inside the frame
+
+        # Window title in a large, bold font
+        create_label(self.mode.title, get_font("Arial", 22, QFont.Weight.Bold), main_frame_layout)
+        main_frame_layout.addSpacing(20)  # Add vertical space
+
+        # Create input field with label
+        self.number_entry = create_input_field(self.mode.input_label, main_frame_layout)
+
+        # Spacer to push buttons to the bottom of the frame
+        main_frame_layout.addStretch()
+
+        # Action buttons at the bottom, arranged horizontally and centered
+        button_layout = configure_layout(QHBoxLayout(), margins=None, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        # Encrypt or decrypt button
+        action_button = QPushButton(self.mode.button_label)
+        action_button.setFont(get_font("Arial", 14, QFont.Weight.Bold))
+        action_button.setObjectName(self.mode.button_name)  # Styled by the global stylesheet
+        action_button.clicked.connect(self.perform_action)  # Connect to processing method
+
+        # Create a back button and add both buttons to layouts
+        create_back_button(self.main_window, action_button, button_layout, main_frame_layout)
+
+        # Add the main frame to the page's main layout
+        main_layout.addWidget(main_frame)
+
+    def perform_action(self):
+        """
+        Process the request when the Encrypt or Decrypt button is clicked.
+
+        Gets the number from the input field, validates it, processes it using the
+        crypto function of the page's mode, and displays the result
+        in the main window's result dialog. If the input is invalid, it shows an error message.
+
+        The input field is cleared after either successful processing or an error.
+        """
+        # Get the number from the input field
+        number = self.number_entry.text()
+
+        # Encrypt or decrypt the number using the algorithm from the crypto module
+        result = self.mode.fn(number)
+
+        if result:
+            # If processing was successful, show the result in the main window's modal dialog
+            self.main_window.show_result(result)
+        else:
+            # If processing failed (invalid input), show an error message
+            QMessageBox.critical(
+                self,  # Parent widget
+                "Input Error",  # Dialog title
+                "Please enter a 6-digit number."  # Error message
+            )
+
+        # Clear the input field so the user can enter another number
+        self.number_entry.clear()
@@ -2,175 +2,147 @@
 Main window for the encryption/decryption application.
 
 This module defines the MainWindow class, which is the primary container for the application's
-user interface. It creates a window with a stacked widget that can display different pages:
+user interface. It creates a window that switches between different pages:
 - Main page: Shows the application title, author information, and buttons to navigate to the encryption and decryption pages.
 - Encryption page: Allows the user to enter a 6-digit number to encrypt.
 - Decryption page: Allows the user to enter a 6-digit encrypted number to decrypt.
 
-The main window also handles navigation between these pages and ensures the window is
-properly centered on the screen.
+The main window also handles navigation between these pages and centers itself on the
+screen when shown.
 """
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QStackedWidget, QFrame,
-    QGraphicsOpacityEffect
+    QLabel, QPushButton
 )
 
-from windows.decrypt_window import DecryptPage
 # Import pages
-from windows.encrypt_window import EncryptPage
-from functions.utils import center_on_screen
+from windows.crypto_page import CryptoPage, ENCRYPT_MODE, DECRYPT_MODE
+from windows.result_window import ResultDialog
+from functions.utils import (
+    FadedImageLoader, StyledFrame, asset_path, cache_faded_image, center_on_screen,
+    configure_layout, create_label, find_faded_pixmap, get_font
+)
+
+# Application name, used for both the window title and the main page title
+APP_TITLE = "Encryption Application"
 
 
 class MainWindow(QMainWindow):
     """
     Main Application Window using PyQt6.
 
-    This class represents the main window of the application. It contains a stacked widget
-    that allows switching between different pages (main, encryption, and decryption).
+    This class represents the main window of the application. It switches between different
+    pages (main, encryption, and decryption) by showing one and hiding the others.
     The window is styled with a light gray background and has a semi-transparent background image.
     """
+    # Background image file, loaded through the shared pixmap cache
+    BACKGROUND_IMAGE = asset_path("PlaygroundImage.png")
+
+    # Faded background image shared by all windows. This strong reference keeps it alive even
+    # if QPixmapCache evicts it, so the image is decoded from disk only once per process
+    _background_pixmap = None
+
+    # Opacity of the background image: 30% opaque (70% transparent)
+    BACKGROUND_OPACITY = 0.3
+
+    # Minimum change in width or height, in pixels, before the background image is rescaled
+    BACKGROUND_RESCALE_THRESHOLD = 4
+
+    # Quiet time, in milliseconds, after the last resize event before the background is updated
+    BACKGROUND_RESIZE_DELAY = 16
+
     def __init__(self):
         """
         Initialize the main window with all UI components.
 
-        Sets up the window properties, creates the central widget, stacked widget for page
-        navigation, and initializes all pages (main, encryption, and decryption).
+        Sets up the window properties, creates the central widget and its layout, which holds
+        the pages, and the main page. The encryption and decryption pages are created
+        lazily the first time the user navigates to them.
         """
         super().__init__()
+        # Coalesce bursts of resize events into a single background update
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.BACKGROUND_RESIZE_DELAY)
+        self._resize_timer.timeout.connect(self.update_background)
+
         # Set the window title (will be translated to English in UI)
-        self.setWindowTitle("Encryption Application")
-        # Set the initial window size
+        self.setWindowTitle(APP_TITLE)
+        # Set the initial window size; the window is centered on the screen when shown
         self.resize(400, 300)
-        # Set the background color to light gray
-        self.setStyleSheet("background-color: #f5f5f5;")
-
-        # Center the window on the screen for a better user experience
-        self.center_window()
 
         # Create a central widget to hold all UI elements
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
 
-        # Create a stacked widget to manage multiple pages/screens
-        self.stacked_widget = QStackedWidget()
-
-        # Create the main layout for the central widget
-        main_layout = QVBoxLayout(self.central_widget)
-        main_layout.setContentsMargins(20, 20, 20, 20)  # Add some padding around the edges
+        # Create the main layout for the central widget, which holds all pages
+        # Only the current page is visible; hidden pages take no space in the layout
+        self.main_layout = configure_layout(QVBoxLayout(self.central_widget))  # Add some padding around the edges
 
         # Create the main page widget
         self.main_page = QWidget()
-        self.main_page.setStyleSheet("background-color: #f5f5f5;")  # Light gray background
-        self.main_page_layout = QVBoxLayout(self.main_page)
         # Center all elements in the layout
-        self.main_page_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.main_page_layout = configure_layout(
+            QVBoxLayout(self.main_page), margins=None, alignment=Qt.AlignmentFlag.AlignCenter
+        )
 
-        # Load and set up the background image
-        background_image = QPixmap("assets/PlaygroundImage.png")
+        # Set up the label that displays the semi-transparent background image
+        # The main page owns the label; it is looked up by object name when the image is updated
         background_label = QLabel(self.main_page)
-        background_label.setPixmap(background_image)
+        background_label.setObjectName("backgroundLabel")
         background_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        background_label.setScaledContents(True)  # Scale image to fit the label
-
-        # Create a semi-transparent effect for the background image
-        opacity_effect = QGraphicsOpacityEffect()
-        opacity_effect.setOpacity(0.3)  # 30% opacity (70% transparent)
-        background_label.setGraphicsEffect(opacity_effect)
-
-        # Make the background image fill the entire widget
-        background_label.setGeometry(0, 0, self.width(), self.height())
 
         # Ensure the background image is behind all other widgets
         background_label.lower()
 
-        # Store the background label as an instance variable to prevent garbage collection
-        self.background_label = background_label
+        # Decode the background image on a worker thread unless it is already loaded,
+        # so the window appears right away with a plain background until it is ready
+        self._background_loader = None
+        if MainWindow._background_pixmap is None:
+            MainWindow._background_pixmap = find_faded_pixmap(self.BACKGROUND_IMAGE, self.BACKGROUND_OPACITY)
+        if MainWindow._background_pixmap is None:
+            self._background_loader = FadedImageLoader(self.BACKGROUND_IMAGE, self.BACKGROUND_OPACITY)
+            self._background_loader.signals.loaded.connect(self.on_background_loaded)
+            QThreadPool.globalInstance().start(self._background_loader)
 
-        # Update the background image size when a window is resized
-        self.resized = lambda event: self.background_label.setGeometry(0, 0, self.width(), self.height())
-        self.resizeEvent = self.resized
+        # Make the background image fill the entire widget
+        self._background_size = None  # Size the background image was last scaled to
+        self.update_background()
 
         # Create the main content frame with a semi-transparent background
-        main_frame = QFrame()
-        main_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.7);  /* Semi-transparent white */
-                border-radius: 5px;  /* Rounded corners */
-            }
-        """)
-        main_frame_layout = QVBoxLayout(main_frame)
-        main_frame_layout.setContentsMargins(20, 20, 20, 20)  # Add padding inside the frame
-
-        # Application title - will be displayed in English
-        title_label = QLabel("Encryption Application")
-        title_label.setFont(QFont("Arial", 22, QFont.Weight.Bold))  # Large, bold font
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the text
-        title_label.setStyleSheet("color: #212121;")  # Dark gray text for readability
-        main_frame_layout.addWidget(title_label)
+        main_frame = StyledFrame()  # Styled by the QFrame#StyledFrame rule in assets/styles.qss
+        main_frame_layout = configure_layout(QVBoxLayout(main_frame))  # Add padding inside the frame
+
+        # Application title in a large, bold font - will be displayed in English
+        create_label(APP_TITLE, get_font("Arial", 22, QFont.Weight.Bold), main_frame_layout)
 
         # Author information with prominent styling
-        author_label = QLabel("Author: Andrés Leonardo Liscano")
-        author_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        author_label.setStyleSheet("""
-            color: #000000;  /* Black text */
-            background-color: #f5f5f5;  /* Light gray background */
-            border-radius: 5px;  /* Rounded corners */
-            padding: 5px 10px;  /* Add some padding */
-        """)
-        main_frame_layout.addWidget(author_label)
+        author_label = create_label(
+            "Author: Andrés Leonardo Liscano", get_font("Arial", 20, QFont.Weight.Bold), main_frame_layout
+        )
+        author_label.setObjectName("authorLabel")  # Styled by the global stylesheet
         main_frame_layout.addSpacing(20)  # Add vertical space
 
         # Instructions for the user
-        info_label = QLabel("Select an option:")
-        info_label.setFont(QFont("Arial", 16))
-        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_label.setStyleSheet("color: #212121;")  # Dark gray text
-        main_frame_layout.addWidget(info_label)
+        create_label("Select an option:", get_font("Arial", 16), main_frame_layout)
         main_frame_layout.addSpacing(10)  # Add a bit of vertical space
 
         # Navigation buttons in a horizontal layout
-        button_layout = QHBoxLayout()
-        button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the buttons
-
-        # Encrypt button with lock emoji
-        encrypt_button = QPushButton("🔒 Encrypt")
-        encrypt_button.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        encrypt_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF0000;  /* Red background */
-                color: white;  /* White text */
-                border: none;  /* No border */
-                border-radius: 5px;  /* Rounded corners */
-                padding: 10px 20px;  /* Add padding for better clickability */
-                min-width: 150px;  /* Minimum width for better appearance */
-            }
-            QPushButton:hover {
-                background-color: #CC0000;  /* Darker red when hovered */
-            }
-        """)
+        button_layout = configure_layout(QHBoxLayout(), margins=None, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        # Encrypt button with lock emoji, sharing its text and style with the encryption page
+        encrypt_button = QPushButton(ENCRYPT_MODE.button_label)
+        encrypt_button.setFont(get_font("Arial", 14, QFont.Weight.Bold))
+        encrypt_button.setObjectName(ENCRYPT_MODE.button_name)  # Styled by the global stylesheet
         encrypt_button.clicked.connect(self.show_encrypt_page)  # Connect to navigation method
         button_layout.addWidget(encrypt_button)
 
-        # Decrypt button with unlocked emoji
-        decrypt_button = QPushButton("🔓 Decrypt")
-        decrypt_button.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        decrypt_button.setStyleSheet("""
-            QPushButton {
-                background-color: #008080;  /* Teal background */
-                color: white;  /* White text */
-                border: none;  /* No border */
-                border-radius: 5px;  /* Rounded corners */
-                padding: 10px 20px;  /* Add padding for better clickability */
-                min-width: 150px;  /* Minimum width for better appearance */
-            }
-            QPushButton:hover {
-                background-color: #006666;  /* Darker teal when hovered */
-            }
-        """)
+        # Decrypt button with unlocked emoji, sharing its text and style with the decryption page
+        decrypt_button = QPushButton(DECRYPT_MODE.button_label)
+        decrypt_button.setFont(get_font("Arial", 14, QFont.Weight.Bold))
+        decrypt_button.setObjectName(DECRYPT_MODE.button_name)  # Styled by the global stylesheet
         decrypt_button.clicked.connect(self.show_decrypt_page)  # Connect to navigation method
         button_layout.addWidget(decrypt_button)
 
@@ -179,55 +151,177 @@ class MainWindow(QMainWindow):
         # Add the main frame to the main page layout
         self.main_page_layout.addWidget(main_frame)
 
-        # Initialize encrypt and decrypt pages
-        self.encrypt_page = EncryptPage(self)  # Page for encryption functionality
-        self.decrypt_page = DecryptPage(self)  # Page for decryption functionality
+        # Encrypt and decrypt pages are created on first navigation to them
+        self._encrypt_page = None  # Page for encryption functionality
+        self._decrypt_page = None  # Page for decryption functionality
 
-        # Add all pages to the stacked widget in order
-        # Index 0: Main page
-        self.stacked_widget.addWidget(self.main_page)
-        # Index 1: Encryption page
-        self.stacked_widget.addWidget(self.encrypt_page)
-        # Index 2: Decryption page
-        self.stacked_widget.addWidget(self.decrypt_page)
+        # Result dialog shared by both pages, created on the first result and reused afterwards
+        self._result_dialog = None
 
-        # Add the stacked widget to the main layout
-        main_layout.addWidget(self.stacked_widget)
+        # Add the main page to the main layout and show it by default;
+        # the other pages are added when created
+        self.main_layout.addWidget(self.main_page)
+        self._current_page = self.main_page
 
-        # Show the main page by default (index 0)
-        self.stacked_widget.setCurrentIndex(0)
+    @property
+    def encrypt_page(self):
+        """
+        The encryption page, created and added hidden to the main layout on first access.
+
+        Returns:
+            CryptoPage: The page for encryption functionality.
+        """
+        if self._encrypt_page is None:
+            self._encrypt_page = CryptoPage(self, ENCRYPT_MODE)
+            self._encrypt_page.hide()  # Hide before adding so the layout does not show it
+            self.main_layout.addWidget(self._encrypt_page)
+        return self._encrypt_page
+
+    @property
+    def decrypt_page(self):
+        """
+        The decryption page, created and added hidden to the main layout on first access.
+
+        Returns:
+            CryptoPage: The page for decryption functionality.
+        """
+        if self._decrypt_page is None:
+            self._decrypt_page = CryptoPage(self, DECRYPT_MODE)
+            self._decrypt_page.hide()  # Hide before adding so the layout does not show it
+            self.main_layout.addWidget(self._decrypt_page)
+        return self._decrypt_page
+
+    def update_background(self):
+        """
+        Make the background image fill the window.
+
+        The label always follows the window size, but the image is only rescaled when the
+        width or height changed by at least BACKGROUND_RESCALE_THRESHOLD pixels since the
+        last rescale, as scaling touches every pixel of the image. While the image is still
+        being loaded, or if it could not be loaded, the label keeps its plain background.
+        """
+        width, height = self.width(), self.height()
+        # Search from the main page: it is not parented to the window until added to the layout
+        background_label = self.main_page.findChild(QLabel, "backgroundLabel")
+        background_label.setGeometry(0, 0, width, height)
+
+        if self._background_loader is not None or MainWindow._background_pixmap.isNull():
+            return
+
+        if self._background_size is not None:
+            last_width, last_height = self._background_size
+            if (abs(width - last_width) < self.BACKGROUND_RESCALE_THRESHOLD
+                    and abs(height - last_height) < self.BACKGROUND_RESCALE_THRESHOLD):
+                return
+
+        self._background_size = (width, height)
+        background_label.setPixmap(MainWindow._background_pixmap.scaled(
+            width, height,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        ))
+
+    def on_background_loaded(self, faded_image):
+        """
+        Display the background image once the worker thread has loaded it.
+
+        Runs in the GUI thread, where the image is converted to a pixmap that is kept
+        by the class and shared through the pixmap cache.
+
+        Args:
+            faded_image (QImage): The background image with its opacity applied.
+        """
+        MainWindow._background_pixmap = cache_faded_image(
+            self.BACKGROUND_IMAGE, self.BACKGROUND_OPACITY, faded_image
+        )
+        self._background_loader = None
+        self._background_size = None  # Force a rescale now that the image is available
+        self.update_background()
+
+    def resizeEvent(self, event):
+        """
+        Handle window resize events by scheduling a background image update.
+
+        Restarting the single-shot timer on every event means a drag that emits many
+        resize events only updates the background once it pauses.
+
+        Args:
+            event (QResizeEvent): The resize event.
+        """
+        self._resize_timer.start()
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        """
+        Center the window on the screen when the application shows it.
+
+        Centering here, rather than in the constructor, uses the window's final geometry.
+        Spontaneous show events, such as restoring a minimized window, keep the position
+        chosen by the user.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        if not event.spontaneous():
+            center_on_screen(self)
+        super().showEvent(event)
+
+    def show_page(self, page):
+        """
+        Make the given page the visible one.
+
+        Hides the current page and shows the given one. Nothing is done if the page is
+        already visible, to avoid redundant hide/show events. Repaints are suspended during
+        the switch, so the window is painted once with the new page instead of between
+        the hide and the show.
+
+        Args:
+            page (QWidget): The page to show. It must already be in the main layout.
+        """
+        if page is self._current_page:
+            return
+        self.setUpdatesEnabled(False)
+        self._current_page.hide()
+        page.show()
+        self._current_page = page
+        self.setUpdatesEnabled(True)
 
     def show_main_page(self):
         """
         Navigate to the main page.
 
-        Sets the stacked widget's current index to 0, which corresponds to the main page.
         This method is called when the user clicks the "Back" button on the encrypt or decrypt pages.
         """
-        self.stacked_widget.setCurrentIndex(0)
+        self.show_page(self.main_page)
 
     def show_encrypt_page(self):
         """
-        Navigate to the encryption page.
+        Navigate to the encryption page, creating it if needed.
 
-        Sets the stacked widget's current index to 1, which corresponds to the encryption page.
         This method is called when the user clicks the "Encrypt" button on the main page.
         """
-        self.stacked_widget.setCurrentIndex(1)
+        self.show_page(self.encrypt_page)
 
     def show_decrypt_page(self):
         """
-        Navigate to the decryption page.
+        Navigate to the decryption page, creating it if needed.
 
-        Sets the stacked widget's current index to 2, which corresponds to the decryption page.
         This method is called when the user clicks the "Decrypt" button on the main page.
         """
-        self.stacked_widget.setCurrentIndex(2)
+        self.show_page(self.decrypt_page)
 
-    def center_window(self):
+    def show_result(self, result):
         """
-        Center the window on the screen.
+        Show an encryption/decryption result in a modal dialog.
+
+        A single ResultDialog is shared by the encryption and decryption pages. It is created
+        the first time a result is shown; later results only replace the displayed text.
+        This method is called by the pages after a successful encryption or decryption.
 
-        Uses the center_on_screen utility function to center the window.
+        Args:
+            result (str): The encryption/decryption result to display.
         """
-        center_on_screen(self)
+        if self._result_dialog is None:
+            self._result_dialog = ResultDialog(self)
+        self._result_dialog.set_result(result)
+        self._result_dialog.exec()  # Show the dialog modally (blocks interaction with the main window)
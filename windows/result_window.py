@@ -5,11 +5,9 @@ This module defines the ResultDialog class, which creates a modal dialog to disp
 the results of encryption or decryption operations. It includes a copy-to-clipboard
 functionality and can be closed by clicking anywhere on the dialog.
 """
-import pyperclip
-from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFrame, QLabel, QPushButton, QApplication
-from functions.utils import center_on_parent
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QApplication
+from functions.utils import StyledFrame, center_on_parent, configure_layout, create_label, get_font
 
 
 class ResultDialog(QDialog):
@@ -30,78 +28,72 @@ class ResultDialog(QDialog):
             result: The encryption/decryption result to display.
         """
         super().__init__(parent)
+        self.result = result
         self.setWindowTitle("Result")  # Dialog title
         self.setFixedSize(400, 200)  # Fixed size for a consistent appearance
-        self.setStyleSheet("background-color: #f5f5f5;")  # Light gray background
 
         # Main layout with padding
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)  # Add padding around the edges
+        layout = configure_layout(QVBoxLayout(self))  # Add padding around the edges
 
         # Result frame with a semi-transparent background
-        result_frame = QFrame()
-        result_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.7);  /* Semi-transparent white */
-                border-radius: 5px;  /* Rounded corners */
-            }
-        """)
+        result_frame = StyledFrame()  # Styled by the QFrame#StyledFrame rule in assets/styles.qss
         result_layout = QVBoxLayout(result_frame)
 
-        # Result label displaying the encryption/decryption result
-        result_label = QLabel(result)
-        result_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))  # Large, bold font
-        result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)  # Center the text
-        result_label.setStyleSheet("color: #212121;")  # Dark gray text for readability
-        result_layout.addWidget(result_label)
+        # Result label displaying the encryption/decryption result in a large, bold font
+        self.result_label = create_label(result, get_font("Arial", 20, QFont.Weight.Bold), result_layout)
 
         # Copy button with the clipboard icon
         copy_button = QPushButton("📋 Copy")
-        copy_button.setFont(QFont("Arial", 14))
-        copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;  /* Blue background */
-                color: white;  /* White text */
-                border: none;  /* No border */
-                border-radius: 5px;  /* Rounded corners */
-                padding: 10px 20px;  /* Add padding for better clickability */
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;  /* Darker blue when hovered */
-            }
-        """)
-        # Connect button click to copy function
-        copy_button.clicked.connect(lambda: self.copy_to_clipboard(result))
+        copy_button.setFont(get_font("Arial", 14))
+        copy_button.setObjectName("copyButton")  # Styled by the global stylesheet
+        # Connect button click to copy function, which reads the current result on each click
+        copy_button.clicked.connect(self.copy_result)
         result_layout.addWidget(copy_button)
 
         # Add the result frame to the main layout
         layout.addWidget(result_frame)
 
-        # Allow closing the dialog by clicking anywhere on it
-        self.mousePressEvent = lambda event: self.close()
-
-    def copy_to_clipboard(self, text):
+    def mousePressEvent(self, event):
         """
-        Copy the provided text to the clipboard and close the dialog.
-
-        Uses both pyperclip and QApplication.clipboard() for maximum compatibility
-        across different platforms.
+        Allow closing the dialog by clicking anywhere on it.
 
         Args:
-            text: The text to copy to the clipboard.
+            event (QMouseEvent): The mouse press event.
         """
-        # Use pyperclip for better cross-platform support
-        pyperclip.copy(text)
-        # Also use Qt's clipboard for redundancy
-        QApplication.clipboard().setText(text)
-        # Close the dialog after copying
         self.close()
 
-    def center_dialog(self):
+    def showEvent(self, event):
         """
-        Center the dialog relative to its parent window.
+        Center the dialog relative to its parent window each time it is shown.
 
-        Uses the center_on_parent utility function to center the dialog relative to its parent,
-        or on the screen if there is no parent.
+        Uses the center_on_parent utility function, which falls back to centering
+        on the screen if there is no parent.
+
+        Args:
+            event (QShowEvent): The show event.
         """
         center_on_parent(self)
+        super().showEvent(event)
+
+    def set_result(self, result):
+        """
+        Replace the displayed result so the dialog can be reused.
+
+        Only the label text and the text to copy are updated; the widgets are kept.
+
+        Args:
+            result: The encryption/decryption result to display.
+        """
+        self.result = result
+        self.result_label.setText(result)
+
+    def copy_result(self):
+        """
+        Copy the currently displayed result to the clipboard and close the dialog.
+
+        Uses Qt's clipboard, which works across platforms without spawning
+        external clipboard tools.
+        """
+        QApplication.clipboard().setText(self.result)
+        # Close the dialog after copying
+        self.close()